@@ -1,117 +1,381 @@
 from __future__ import annotations
-import requests
-from typing import Optional
-from moondock.config import DISCORD_WEBHOOK, HTTP_TIMEOUT_SECONDS
+import asyncio, random, threading, warnings
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+import aiohttp
+from moondock.config import DISCORD_WEBHOOKS, HTTP_TIMEOUT_SECONDS
 from moondock.events.parser import NormalizedEvent
 from moondock.logger import logger
 
+try:
+    import orjson
+
+    def _dumps(payload: dict) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:
+    import json
+
+    def _dumps(payload: dict) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+# Embed description templates (one format call per event), table-like alignment
+_CONTAINER_TMPL = (
+    "```Domain      : {domain}\n"
+    "Action      : {action}\n"
+    "Name        : {name}\n"
+    "Image       : {image}\n"
+    "ID          : {id12}```"
+)
+_CONTAINER_EXIT_TMPL = _CONTAINER_TMPL[:-3] + "\nExit Code   : {exit_code}```"
+_NETWORK_TMPL = (
+    "```Domain      : {domain}\n"
+    "Action      : {action}\n"
+    "Network     : {name}\n"
+    "Container   : {name}```"
+)
+_GENERIC_TMPL = (
+    "```Domain      : {domain}\n"
+    "Action      : {action}\n"
+    "ID          : {id12}```"
+)
+
+def _resolve(result: Future, value: bool) -> None:
+    # A caller may have cancelled the Future, or close() may have failed it already
+    if not result.done():
+        result.set_result(value)
+
+def _parse_seconds(value: Any, default: float) -> float:
+    # Rate-limit values come from the network: ignore anything that is not a sane duration
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return default
+    if not 0 <= seconds < 3600:
+        return default
+    return seconds
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the process-wide asyncio loop used for Discord I/O,
+    starting it on a dedicated daemon thread on first use.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                daemon=True,
+                name="DiscordClientLoop"
+            ).start()
+        return _loop
+
 class DiscordClient:
     """
     Discord webhook client using embeds for nicely formatted messages.
+    HTTP I/O runs on a background asyncio loop with a single keep-alive
+    aiohttp session, so send_event() never blocks the caller thread.
     """
 
-    # Map actions to emojis and embed colors
-    ACTION_EMOJIS = {
-        "die": "🪦 ",
-        "kill": "💀 ",
-        "oom": "💥 ",
-        "restart": "⟲ ",
-        "start": "▶️ ",
-        "stop": "⏹️ ",
-        "create": "🏗️ ",
-        "destroy": "🗑️ ",
-        "pause": "⏸️ ",
-        "unpause": "▶️ ",
-        "health_healthy": "❤️ ",
-        "health_unhealthy": "💔 ",
-        "pull": "⬇️ ",
-        "push": "⬆️ ",
-        "connect": "🔗 ",
-        "disconnect": "⛓️ ",
-        "attach": "🔌 "
+    # Map actions to (emoji, embed color)
+    ACTION_STYLE: Dict[str, Tuple[str, int]] = {
+        "die": ("🪦 ", 0xFF0000),              # Bright Red — critical
+        "kill": ("💀 ", 0xFF4500),             # OrangeRed — high impact
+        "oom": ("💥 ", 0xFF6347),              # Tomato — warning
+        "restart": ("⟲ ", 0x1E90FF),           # Dodger Blue — restart
+        "start": ("▶️ ", 0x00FF00),            # Green — OK
+        "stop": ("⏹️ ", 0x808080),             # Gray — neutral
+        "create": ("🏗️ ", 0x00CED1),           # Dark Turquoise — info
+        "destroy": ("🗑️ ", 0x8B0000),          # Maroon — final critical
+        "pause": ("⏸️ ", 0x808080),            # Gray — neutral
+        "unpause": ("▶️ ", 0x808080),          # Gray — neutral
+        "health_healthy": ("❤️ ", 0x00FF00),   # Red — OK
+        "health_unhealthy": ("💔 ", 0x00FF00), # Red — critical
+        "pull": ("⬇️ ", 0x1E90FF),             # Blue — info
+        "push": ("⬆️ ", 0x1E90FF),             # Blue — info
+        "connect": ("🔗 ", 0xFFFF00),          # Yellow — minor warning
+        "disconnect": ("⛓️ ", 0xFFA500),       # Orange — warning
+        "attach": ("🔌 ", 0x00CED1),           # Dark Turquoise — info
     }
+    _DEFAULT_STYLE: Tuple[str, int] = ("", 0x808080)
 
-    ACTION_COLORS = {
-        "die": 0xFF0000,         # Bright Red — critical
-        "kill": 0xFF4500,        # OrangeRed — high impact
-        "oom": 0xFF6347,         # Tomato — warning
-        "restart": 0x1E90FF,     # Dodger Blue — restart
-        "start": 0x00FF00,       # Green — OK
-        "stop": 0x808080,        # Gray — neutral
-        "create": 0x00CED1,      # Dark Turquoise — info
-        "connect": 0xFFFF00,     # Yellow — minor warning
-        "disconnect": 0xFFA500,  # Orange — warning
-        "destroy": 0x8B0000,     # Maroon — final critical
-        "pull": 0x1E90FF,        # Blue — info
-        "push": 0x1E90FF,        # Blue — info
-        "attach": 0x00CED1,      # Dark Turquoise — info
-        "health_healthy": 0x00FF00,    # Red — OK
-        "health_unhealthy": 0x00FF00   # Red — critical
-    }
+    # Discord accepts at most 10 embeds per webhook message
+    MAX_EMBEDS_PER_MESSAGE = 10
+    MAX_RATE_LIMIT_RETRIES = 3
+    # Embeds waiting for the flusher; beyond this new events are dropped
+    MAX_QUEUED_EMBEDS = 1000
+    # Local budget kept just under Discord's per-webhook limit (5 requests / 2s)
+    RATE_LIMIT_REQUESTS = 5
+    RATE_LIMIT_WINDOW = 2.0
 
-    def __init__(self, webhook_url: Optional[str] = None, timeout: int = HTTP_TIMEOUT_SECONDS):
-        self.webhook_url = webhook_url or DISCORD_WEBHOOK
+    def __init__(
+        self,
+        webhook_urls: Union[str, Sequence[str], None] = None,
+        timeout: int = HTTP_TIMEOUT_SECONDS,
+        webhook_url: Optional[str] = None,
+    ):
+        if webhook_url is not None:
+            warnings.warn(
+                "DiscordClient(webhook_url=...) is deprecated, use webhook_urls=...",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            if webhook_urls is None:
+                webhook_urls = webhook_url
+
+        # None or "" falls back to DISCORD_WEBHOOK (as before); pass [] for no webhooks
+        if not webhook_urls and not isinstance(webhook_urls, (list, tuple)):
+            webhook_urls = DISCORD_WEBHOOKS
+        elif isinstance(webhook_urls, str):
+            webhook_urls = [webhook_urls]
+        webhook_urls = list(webhook_urls)
+
+        # Webhook URLs embed their secret token: never log them, only their position
+        self.webhook_urls: List[str] = []
+        for index, url in enumerate(webhook_urls):
+            if url.startswith(("https://", "http://")):
+                self.webhook_urls.append(url)
+            else:
+                logger.error("Ignoring Discord webhook #%d: URL must start with https://", index)
         self.timeout = timeout
+        # _closing: set by close() on the caller thread, rejects new send_event() calls
+        # _closed: set on the loop, so enqueues scheduled before close() are still accepted
+        self._closing = False
+        self._closed = False
 
-        if not self.webhook_url:
+        if not self.webhook_urls:
             logger.warning("Discord webhook URL is not set. Messages will not be sent.")
 
-    def send_event(self, event: NormalizedEvent) -> bool:
+        self._loop = _get_loop()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+
+    async def _start(self) -> None:
+        # Session and queue must be created inside the loop that will use them
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+            headers={"Content-Type": "application/json"},
+        )
+        # per-webhook send times: Discord rate limits each webhook separately
+        self._sent_at: Dict[str, Deque[float]] = {url: deque() for url in self.webhook_urls}
+        # loop time until which a webhook's bucket is exhausted (X-RateLimit-Reset-After)
+        self._blocked_until: Dict[str, float] = {}
+        self._queue: asyncio.Queue[Tuple[dict, Future]] = asyncio.Queue(maxsize=self.MAX_QUEUED_EMBEDS)
+        self._in_flight: List[Tuple[dict, Future]] = []
+        self._flusher_task = asyncio.create_task(self._flusher())
+
+    def send_event(self, event: NormalizedEvent) -> Future:
         """
-        Sends a Discord embed message for the given Docker event.
+        Queues a Discord embed message for the given Docker event (thread-safe).
+        Returns a Future resolving to True when Discord accepted the message.
         """
-        if not self.webhook_url:
+        result: Future = Future()
+
+        if not self.webhook_urls:
             logger.debug("No webhook URL configured, skipping Discord send.")
-            return False
+            result.set_result(False)
+            return result
+
+        if self._closing:
+            logger.debug("Discord client is closed, skipping Discord send.")
+            result.set_result(False)
+            return result
 
         embed = self._build_embed(event)
-        payload = {"embeds": [embed]}
+        self._loop.call_soon_threadsafe(self._enqueue, embed, result)
+        return result
+
+    def _enqueue(self, embed: dict, result: Future) -> None:
+        """
+        Runs on the client loop: queues the embed, or resolves the Future
+        with False when the queue is full.
+        """
+        if self._closed:
+            _resolve(result, False)
+            return
 
         try:
-            response = requests.post(self.webhook_url, json=payload, timeout=self.timeout)
-            if response.status_code in (200, 204):
-                logger.info("Event sent to Discord successfully.")
-                return True
-            else:
-                logger.error(
-                    "Failed to send event to Discord: %s %s",
-                    response.status_code,
-                    response.text
-                )
+            self._queue.put_nowait((embed, result))
+        except asyncio.QueueFull:
+            logger.warning("Discord queue full (%d); dropping event.", self._queue.maxsize)
+            _resolve(result, False)
+
+    def close(self) -> None:
+        """
+        Flushes pending embeds and closes the HTTP session.
+        Events still pending after the flush timeout resolve to False,
+        as does any send_event() call made after close().
+        """
+        self._closing = True
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result()
+
+    async def _close(self) -> None:
+        # Runs after every enqueue already scheduled on the loop, which are flushed below
+        self._closed = True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out flushing %d pending Discord event(s).", self._queue.qsize())
+
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+
+        # Nothing drains the queue anymore: fail the in-flight batch and leftovers
+        for _, result in self._in_flight:
+            _resolve(result, False)
+        while not self._queue.empty():
+            _, result = self._queue.get_nowait()
+            _resolve(result, False)
+
+        await self._session.close()
+        logger.info("Discord client closed.")
+
+    async def _flusher(self) -> None:
+        """
+        Drains the embed queue, grouping whatever is pending (up to
+        MAX_EMBEDS_PER_MESSAGE) into a single webhook POST.
+        """
+        while True:
+            batch = [await self._queue.get()]
+
+            while len(batch) < self.MAX_EMBEDS_PER_MESSAGE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._in_flight = batch
+
+            try:
+                sent = await self._post_embeds([embed for embed, _ in batch])
+            except Exception as exc:
+                logger.exception("Unexpected error while flushing Discord events: %s", exc)
+                sent = False
+
+            for _, result in batch:
+                _resolve(result, sent)
+                self._queue.task_done()
+            self._in_flight = []
+
+    async def _throttle(self, url: str) -> None:
+        """
+        Local sliding-window limiter: stalls before the remote webhook
+        limit is reached instead of waiting for a 429, and until an
+        exhausted bucket reported by Discord has reset.
+        """
+        blocked_for = self._blocked_until.pop(url, 0.0) - self._loop.time()
+        if blocked_for > 0:
+            await asyncio.sleep(blocked_for)
+
+        sent_at = self._sent_at[url]
+        now = self._loop.time()
+        while sent_at and now - sent_at[0] >= self.RATE_LIMIT_WINDOW:
+            sent_at.popleft()
+
+        if len(sent_at) >= self.RATE_LIMIT_REQUESTS:
+            await asyncio.sleep(self.RATE_LIMIT_WINDOW - (now - sent_at[0]))
+
+        sent_at.append(self._loop.time())
+
+    async def _post_embeds(self, embeds: List[dict]) -> bool:
+        """
+        Sends a batch of embeds to every configured webhook concurrently.
+        Returns True only when all webhooks accepted the message.
+        """
+        # serialized once, shared by all webhooks and retries
+        body = _dumps({"embeds": embeds})
+
+        results = await asyncio.gather(
+            *(self._post_to(index, url, body, len(embeds)) for index, url in enumerate(self.webhook_urls)),
+            return_exceptions=True
+        )
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error("Unexpected error while sending to Discord webhook #%d: %s", index, type(result).__name__)
+        return all(result is True for result in results)
+
+    async def _post_to(self, index: int, url: str, body: bytes, count: int) -> bool:
+        """
+        Sends one serialized message to a single webhook, honoring Discord
+        rate-limit headers and retrying 429 responses with jittered backoff.
+        """
+        for attempt in range(1, self.MAX_RATE_LIMIT_RETRIES + 2):
+            await self._throttle(url)
+            retry_after: Optional[float] = None
+            try:
+                async with self._session.post(url, data=body) as response:
+                    if response.status == 429:
+                        retry_after = await self._retry_after(response)
+                    elif response.status in (200, 204):
+                        logger.info("%d event(s) sent to Discord successfully.", count)
+                        if response.headers.get("X-RateLimit-Remaining") == "0":
+                            # bucket exhausted: the next send to this webhook waits for the reset
+                            reset_after = _parse_seconds(response.headers.get("X-RateLimit-Reset-After"), 0.0)
+                            self._blocked_until[url] = self._loop.time() + reset_after
+                        return True
+                    else:
+                        logger.error(
+                            "Failed to send event to Discord: %s %s",
+                            response.status,
+                            await response.text()
+                        )
+                        return False
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # the exception text may contain the URL (e.g. InvalidURL): log its type only
+                logger.error("Exception while sending event to Discord webhook #%d: %s", index, type(e).__name__)
                 return False
-        except requests.RequestException as e:
-            logger.error("Exception while sending event to Discord: %s", e)
-            return False
+
+            if attempt > self.MAX_RATE_LIMIT_RETRIES:
+                # no retry left: don't stall the flusher waiting for nothing
+                break
+
+            delay = retry_after + random.uniform(0, 0.25 * attempt)
+            logger.warning(
+                "Discord rate limit hit, retrying in %.2fs (attempt %d).",
+                delay, attempt
+            )
+            await asyncio.sleep(delay)
+
+        logger.error("Giving up on Discord message after %d rate-limited attempts.", self.MAX_RATE_LIMIT_RETRIES + 1)
+        return False
+
+    @staticmethod
+    async def _retry_after(response: aiohttp.ClientResponse) -> float:
+        """
+        Seconds to wait after a 429, from the JSON body or the Retry-After header.
+        """
+        header = _parse_seconds(response.headers.get("Retry-After"), 1.0)
+        try:
+            body = await response.json(content_type=None)
+            return _parse_seconds(body.get("retry_after"), header)
+        except (ValueError, AttributeError, aiohttp.ClientError):
+            return header
 
     def _build_embed(self, event: NormalizedEvent) -> dict:
         """
         Build a Discord embed dictionary from a NormalizedEvent with table-like alignment.
         """
-        emoji = self.ACTION_EMOJIS.get(event.action, "")
-        color = self.ACTION_COLORS.get(event.action, 0x808080)
-
-        table_lines = [
-            f"Domain      : {event.domain}",
-            f"Action      : {event.action}"
-        ]
+        emoji, color = self.ACTION_STYLE.get(event.action, self._DEFAULT_STYLE)
 
         if event.domain == "container":
-            table_lines.extend([
-                f"Name        : {event.name or 'N/A'}",
-                f"Image       : {event.image or 'N/A'}",
-                f"ID          : {event.id[:12]}",
-            ])
-            if event.exit_code is not None:
-                table_lines.append(f"Exit Code   : {event.exit_code}")
+            template = _CONTAINER_TMPL if event.exit_code is None else _CONTAINER_EXIT_TMPL
         elif event.domain == "network":
-            table_lines.extend([
-                f"Network     : {event.name or 'N/A'}",
-                f"Container   : {event.name or 'N/A'}"
-            ])
+            template = _NETWORK_TMPL
         else:
-            table_lines.append(f"ID          : {event.id[:12] if event.id else '<unknown>'}")
+            template = _GENERIC_TMPL
 
-        description = "```" + "\n".join(table_lines) + "```"
+        description = template.format(
+            domain=event.domain,
+            action=event.action,
+            name=event.name or "N/A",
+            image=event.image or "N/A",
+            id12=event.short_id,
+            exit_code=event.exit_code,
+        )
 
         embed = {
             "title": f"{emoji} Docker Event Detected",
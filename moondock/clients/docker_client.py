@@ -1,5 +1,8 @@
 from __future__ import annotations
-import docker, os
+from functools import lru_cache
+from pathlib import Path
+import docker
+from urllib3.util.retry import Retry
 from docker.errors import DockerException
 from moondock.config import (
     DOCKER_HOST,
@@ -8,12 +11,12 @@ from moondock.config import (
 )
 from moondock.logger import logger
 
-cert_path = os.path.normpath(DOCKER_CERT_PATH)
-
+@lru_cache(maxsize=1)
 def _build_tls_config():
     """
     Builds TLS configuration for tcp:// connections.
-    Returns None when TLS is disabled.
+    Returns None when TLS is disabled. The result is cached, so
+    reconnects reuse the same TLSConfig.
     """
     if not DOCKER_TLS_VERIFY:
         return None
@@ -22,12 +25,14 @@ def _build_tls_config():
         logger.error("TLS enabled but DOCKER_CERT_PATH not provided.")
         raise RuntimeError("TLS is enabled but certificate path is missing.")
     
+    cert_path = Path(DOCKER_CERT_PATH)
+
     return docker.tls.TLSConfig(
         client_cert=(
-            f"{cert_path}/cert.pem",
-            f"{cert_path}/key.pem",
+            str(cert_path / "cert.pem"),
+            str(cert_path / "key.pem"),
         ),
-        ca_cert=f"{cert_path}/ca.pem",
+        ca_cert=str(cert_path / "ca.pem"),
         verify=True
     )
 
@@ -40,7 +45,7 @@ def init_docker() -> docker.DockerClient:
         - tcp://127.0.0.1:2376 (secure)
     """
 
-    logger.info(f"Initializing Docker client - host: {DOCKER_HOST}")
+    logger.info("Initializing Docker client - host: %s", DOCKER_HOST)
 
     tls_config = None
 
@@ -60,11 +65,17 @@ def init_docker() -> docker.DockerClient:
             tls=tls_config,
         )
 
-        # Testing connectivity
+        # Retry transient connect failures inside the pooled adapter (unix or tcp)
+        # instead of surfacing them to the watcher's reconnect loop. Read/status
+        # retries stay off so a hung daemon fails after one timeout, not ten.
+        adapter = client.api.get_adapter(client.api.base_url)
+        adapter.max_retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.25)
+
+        # Testing connectivity (also leaves a warm pooled connection)
         client.ping()
         logger.info("Docker client initialized successfully.")
 
         return client
     except DockerException as e:
-        logger.critical(f"Failed to connect to Docker Engine: {e}")
+        logger.critical("Failed to connect to Docker Engine: %s", e)
         raise RuntimeError(f"Could not connect to Docker daemon: {e}")
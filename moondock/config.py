@@ -1,36 +1,75 @@
 from __future__ import annotations
-from typing import List 
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
 from dotenv import load_dotenv
 import os
 
-load_dotenv()
+# Critical events (default values). Can be overrided for a env var CSV
+_default_events = ["die", "oom", "kill", "restart"]
 
-# Discord Webhook (unique string). Absolute necessary in production environment
-DISCORD_WEBHOOK: str = os.getenv("DISCORD_WEBHOOK", "").strip()
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Config: immutable snapshot of the MoonDock environment settings.
+    - discord_webhook: raw DISCORD_WEBHOOK value, one webhook URL or a CSV of them. Absolute necessary in production environment
+    - discord_webhooks: webhooks parsed from discord_webhook as CSV (every one receives each alert)
+    - docker_host: Docker Engine host. Default -> unix:///var/run/docker.sock for local environment (secure pattern)
+    - docker_tls_verify / docker_cert_path: only used in TCP connection mode with TLS
+    - critical_events: events worth alerting about
+    - log_level: logging base config
+    - http_timeout_seconds: timeout for requests (Discord, etc)
+    """
+    discord_webhook: str
+    discord_webhooks: Tuple[str, ...]
+    docker_host: str
+    docker_tls_verify: bool
+    docker_cert_path: str
+    critical_events: Tuple[str, ...]
+    log_level: str
+    http_timeout_seconds: int
 
-# Docker Engine host. Default -> unix:///var/run/docker.sock for local environment (secure pattern)
-# If necessary, change to -> tcp://host:2375 (2375 for normal TLS communication)
-DOCKER_HOST: str = os.getenv("DOCKER_HOST", "unix:///var/run/docker.sock").strip()
+@lru_cache(maxsize=1)
+def _load_config() -> Config:
+    """
+    Reads the environment (and .env file) once and returns the parsed Config.
+    """
+    load_dotenv()
 
-# If using connection mode as TCP with TLS:
-DOCKER_TLS_VERIFY: bool = os.getenv("DOCKER_TLS_VERIFY", "").strip() in ("1", "true", "True")
-DOCKER_CERT_PATH: str = os.getenv("DOCKER_CERT_PATH", "").strip()
+    discord_webhook = os.getenv("DISCORD_WEBHOOK", "").strip()
 
-# Critical events (default values). Can be overrided for a env var CSV
-_default_events = ["die", "oom", "kill", "restart"]
-CRITICAL_EVENTS: List[str] = [
-    e.strip() for e in os.getenv("CRITICAL_EVENTS", ",".join(_default_events)).strip(",") if e.strip()
-]
-
-# Logging base config
-LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
-
-# Timeout for requests (Discord, etc)
-HTTP_TIMEOUT_SECONDS: int = int(os.getenv("HTTP_TIMEOUT_SECONDS", "5"))
-
-# Recommendations / safety hints (debug helper step)
-if DOCKER_HOST.startswith("tcp://") and not DOCKER_TLS_VERIFY:
-    # don't use exception - only print for development environments. Main logging may realize this verification step.
-    print("WARNING: DOCKER_HOST is configured as TCP without TLS. This is insecure for production environments.")
-if not DISCORD_WEBHOOK:
-    print("WARNING: DISCORD_WEBHOOK not configured — alerts will not be sent to Discord.")
\ No newline at end of file
+    config = Config(
+        discord_webhook=discord_webhook,
+        discord_webhooks=tuple(w.strip() for w in discord_webhook.split(",") if w.strip()),
+        # If necessary, change to -> tcp://host:2375 (2375 for normal TLS communication)
+        docker_host=os.getenv("DOCKER_HOST", "unix:///var/run/docker.sock").strip(),
+        docker_tls_verify=os.getenv("DOCKER_TLS_VERIFY", "").strip() in ("1", "true", "True"),
+        docker_cert_path=os.getenv("DOCKER_CERT_PATH", "").strip(),
+        critical_events=tuple(
+            # normalized actions are lowercase, so match them case-insensitively
+            e.strip().lower() for e in os.getenv("CRITICAL_EVENTS", ",".join(_default_events)).split(",") if e.strip()
+        ),
+        log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        http_timeout_seconds=int(os.getenv("HTTP_TIMEOUT_SECONDS", "5")),
+    )
+
+    # Recommendations / safety hints (debug helper step)
+    if config.docker_host.startswith("tcp://") and not config.docker_tls_verify:
+        # don't use exception - only print for development environments. Main logging may realize this verification step.
+        print("WARNING: DOCKER_HOST is configured as TCP without TLS. This is insecure for production environments.")
+    if not config.discord_webhook:
+        print("WARNING: DISCORD_WEBHOOK not configured — alerts will not be sent to Discord.")
+
+    return config
+
+CONFIG: Config = _load_config()
+
+# Module-level aliases kept for existing imports
+DISCORD_WEBHOOK: str = CONFIG.discord_webhook
+DISCORD_WEBHOOKS: Tuple[str, ...] = CONFIG.discord_webhooks
+DOCKER_HOST: str = CONFIG.docker_host
+DOCKER_TLS_VERIFY: bool = CONFIG.docker_tls_verify
+DOCKER_CERT_PATH: str = CONFIG.docker_cert_path
+CRITICAL_EVENTS: Tuple[str, ...] = CONFIG.critical_events
+LOG_LEVEL: str = CONFIG.log_level
+HTTP_TIMEOUT_SECONDS: int = CONFIG.http_timeout_seconds
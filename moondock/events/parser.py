@@ -1,11 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
-import time
+from dataclasses import dataclass, field
+from typing import AbstractSet, Any, Callable, Dict, Optional
+import logging, time
 
 from moondock.logger import logger
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NormalizedEvent:
     """
     NormalizedEvent: canonical event structure used by MoonDock.
@@ -17,7 +17,8 @@ class NormalizedEvent:
     - exit_code: exit code for 'die' events (if present)
     - timestamp: unix epoch seconds (float)
     - attributes: raw Actor.Attributes (helpful for labels, etc)
-    - raw: original raw event dict (for debugging)
+    - raw: original raw event dict, kept only when DEBUG logging is enabled
+    - short_id: first 12 chars of id (computed once, used for display)
     """
     domain: str
     action: str
@@ -27,7 +28,11 @@ class NormalizedEvent:
     exit_code: Optional[int]
     timestamp: float
     attributes: Dict[str, Any]
-    raw: Dict[str, Any]
+    raw: Optional[Dict[str, Any]] = None
+    short_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "short_id", (self.id or "<unknown>")[:12])
 
 # mapping of common docker actions to normalized action names (keeps same where appropriate)
 _ACTION_NORMALIZATION = {
@@ -49,28 +54,33 @@ _ACTION_NORMALIZATION = {
     # generic fallback: we will return the original action lowercased when unknown
 }
 
+# case-insensitive view, built once; values are module constants (already interned)
+_ACTION_NORMALIZATION_CI = {k.lower(): v for k, v in _ACTION_NORMALIZATION.items()}
+
 def _to_timestamp(raw: Dict[str, Any]) -> float:
     """
     Extract a unix seconds timestamp from the raw event.
-    Docker often provides 'time' (seconds) or 'timeNano' (nanoseconds).
-    Fall back to current time if missing.
+    Docker sets both 'time' (seconds) and 'timeNano' (nanoseconds) as ints,
+    so the first one present wins. Fall back to current time if missing or malformed.
     """
-    if raw is None:
-        return time.time()
-
     t = raw.get("time")
-    if isinstance(t, (int, float)) and t > 0:
-        return float(t)
+    if t:
+        try:
+            seconds = float(t)
+            if seconds > 0:
+                return seconds
+        except (TypeError, ValueError):
+            logger.debug("Malformed 'time' in raw event: %r", t)
 
     tnano = raw.get("timeNano")
-    if isinstance(tnano, (int, float)) and tnano > 0:
-        # convert nanoseconds to seconds
-        return float(tnano) / 1e9
-
-    # sometimes there is 'timestamp' or 'timeStamp'
-    t_alt = raw.get("timestamp") or raw.get("timeStamp")
-    if isinstance(t_alt, (int, float)) and t_alt > 0:
-        return float(t_alt)
+    if tnano:
+        try:
+            # convert nanoseconds to seconds
+            seconds = float(tnano * 1e-9)
+            if seconds > 0:
+                return seconds
+        except (TypeError, ValueError):
+            logger.debug("Malformed 'timeNano' in raw event: %r", tnano)
 
     # fallback to now
     return time.time()
@@ -83,7 +93,7 @@ def _normalize_action(raw_action: Optional[str]) -> Optional[str]:
     if not raw_action:
         return None
 
-    # keep exact match first
+    # keep exact match first (Docker actions are already trimmed in practice)
     normalized = _ACTION_NORMALIZATION.get(raw_action)
     if normalized:
         return normalized
@@ -91,13 +101,24 @@ def _normalize_action(raw_action: Optional[str]) -> Optional[str]:
     # Some actions come like "health_status: healthy" — normalize by lowering.
     # For unknown ones, return lowercase trimmed string.
     try:
-        return raw_action.strip().lower()
+        lowered = raw_action.lower()
+        return _ACTION_NORMALIZATION_CI.get(lowered) or lowered.strip()
     except Exception:
         return raw_action
 
-def _safe_get_actor_attributes(raw: Dict[str, Any]) -> Dict[str, Any]:
-    actor = raw.get("Actor") or raw.get("actor") or {}
-    attrs = actor.get("Attributes") or actor.get("attributes") or {}
+# The Docker daemon emits CamelCase keys (Type, Action, Actor.ID, Actor.Attributes)
+# consistently, so only those are probed. The legacy top-level 'id' and 'status'
+# fields are read only as a bonus: older API versions send them, but Engine 25+
+# (API >= 1.44) dropped them, so Actor.ID / Action are the fields to rely on.
+
+def _safe_get_actor(raw: Dict[str, Any]) -> Dict[str, Any]:
+    actor = raw.get("Actor")
+    if not isinstance(actor, dict):
+        return {}
+    return actor
+
+def _safe_get_actor_attributes(actor: Dict[str, Any]) -> Dict[str, Any]:
+    attrs = actor.get("Attributes")
     if not isinstance(attrs, dict):
         return {}
     return attrs
@@ -107,27 +128,23 @@ def _extract_container_info(raw: Dict[str, Any]) -> Dict[str, Any]:
     Extract container-specific info such as name, image, exit code, etc.
     Return a dict with keys: id, name, image, exit_code, attributes.
     """
-    attrs = _safe_get_actor_attributes(raw)
-    container_id = raw.get("id") or raw.get("ID") or attrs.get("container") or attrs.get("id")
+    actor = _safe_get_actor(raw)
+    attrs = _safe_get_actor_attributes(actor)
+    container_id = raw.get("id") or actor.get("ID")
     # container name usually under 'name' attribute
-    name = attrs.get("name") or attrs.get("container") or None
+    name = attrs.get("name") or None
 
-    # image may be under 'image' attribute or 'image.name' etc
-    image = attrs.get("image") or attrs.get("image.name") or None
+    image = attrs.get("image") or None
 
-    # exit code often in 'exitCode', 'exitCode', or 'exit' inside attributes or in raw
+    # exit code is reported as a string 'exitCode' attribute on 'die' events
     exit_code = None
-    for key in ("exitCode", "exit_code", "exit"):
-        val = attrs.get(key)
-        if val is None:
-            val = raw.get(key)
-        if val is not None:
-            try:
-                exit_code = int(val)
-                break
-            except Exception:
-                # not an integer -> ignore
-                exit_code = None
+    val = attrs.get("exitCode")
+    if val is not None:
+        try:
+            exit_code = int(val)
+        except Exception:
+            # not an integer -> ignore
+            exit_code = None
 
     return {
         "id": container_id,
@@ -137,11 +154,54 @@ def _extract_container_info(raw: Dict[str, Any]) -> Dict[str, Any]:
         "attributes": attrs,
     }
 
-def parse_event(raw: Dict[str, Any]) -> Optional[NormalizedEvent]:
+def _handle_container(raw: Dict[str, Any], domain: str, action: str, ts: float) -> NormalizedEvent:
+    """
+    Build a NormalizedEvent for container events (name, image, exit code).
+    """
+    info = _extract_container_info(raw)
+    return NormalizedEvent(
+        domain=domain,
+        action=action,
+        id=info["id"] or "<unknown>",
+        name=info["name"],
+        image=info["image"],
+        exit_code=info["exit_code"],
+        timestamp=ts,
+        attributes=info["attributes"],
+        raw=raw if logger.isEnabledFor(logging.DEBUG) else None,
+    )
+
+def _handle_generic(raw: Dict[str, Any], domain: str, action: str, ts: float) -> NormalizedEvent:
+    """
+    For non-container events we still return a simple normalized representation.
+    """
+    actor = _safe_get_actor(raw)
+    attributes = _safe_get_actor_attributes(actor)
+    return NormalizedEvent(
+        domain=domain,
+        action=action,
+        id=raw.get("id") or actor.get("ID") or "<unknown>",
+        name=attributes.get("name"),
+        image=attributes.get("image"),
+        exit_code=None,
+        timestamp=ts,
+        attributes=attributes,
+        raw=raw if logger.isEnabledFor(logging.DEBUG) else None,
+    )
+
+# Per-domain builders; domains not listed use _handle_generic
+_DOMAIN_HANDLERS: Dict[str, Callable[[Dict[str, Any], str, str, float], NormalizedEvent]] = {
+    "container": _handle_container,
+}
+
+def parse_event(raw: Dict[str, Any], actions: Optional[AbstractSet[str]] = None) -> Optional[NormalizedEvent]:
     """
     Parse a raw docker event dict and return a NormalizedEvent or None if the event
     is not relevant / cannot be normalized.
 
+    When `actions` is given, events whose normalized action is not in it are
+    skipped before any further extraction work.
+
     The function is defensive: it will not raise on malformed input, it will log
     debug information on unexpected shapes.
     """
@@ -149,9 +209,9 @@ def parse_event(raw: Dict[str, Any]) -> Optional[NormalizedEvent]:
         logger.debug("parse_event received non-dict raw event: %r", raw)
         return None
 
-    domain = (raw.get("Type") or raw.get("type") or "unknown").lower()
-    # prefer 'Action', but fallback to 'status' or 'action'
-    raw_action = raw.get("Action") or raw.get("action") or raw.get("status")
+    domain = (raw.get("Type") or "unknown").lower()
+    # prefer 'Action', but fallback to legacy 'status'
+    raw_action = raw.get("Action") or raw.get("status")
     action = _normalize_action(raw_action)
 
     # If action still None, nothing to do
@@ -159,50 +219,15 @@ def parse_event(raw: Dict[str, Any]) -> Optional[NormalizedEvent]:
         logger.debug("parse_event: no action found in raw event: %r", raw)
         return None
 
+    if actions is not None and action not in actions:
+        return None
+
     ts = _to_timestamp(raw)
 
     # Currently focus on container events; still create a normalized event for other domains.
     try:
-        if domain == "container":
-            info = _extract_container_info(raw)
-            event_id = info.get("id") or "<unknown>"
-            name = info.get("name")
-            image = info.get("image")
-            exit_code = info.get("exit_code")
-            attributes = info.get("attributes", {})
-
-            # Build normalized event
-            ne = NormalizedEvent(
-                domain=domain,
-                action=action,
-                id=event_id,
-                name=name,
-                image=image,
-                exit_code=exit_code,
-                timestamp=ts,
-                attributes=attributes,
-                raw=raw,
-            )
-            return ne
-
-        else:
-            # For non-container events we still return a simple normalized representation
-            # Extract id if present
-            resource_id = raw.get("id") or raw.get("ID") or None
-            attributes = _safe_get_actor_attributes(raw)
-            ne = NormalizedEvent(
-                domain=domain,
-                action=action,
-                id=resource_id or "<unknown>",
-                name=attributes.get("name"),
-                image=attributes.get("image"),
-                exit_code=None,
-                timestamp=ts,
-                attributes=attributes,
-                raw=raw,
-            )
-            return ne
-
+        handler = _DOMAIN_HANDLERS.get(domain, _handle_generic)
+        return handler(raw, domain, action, ts)
     except Exception as exc:
         logger.exception("parse_event failed to normalize raw event: %s", exc)
         return None
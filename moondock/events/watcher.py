@@ -1,6 +1,6 @@
 from __future__ import annotations
-import time, threading
-from typing import Callable, Optional, Dict, Any
+import queue, random, threading
+from typing import Callable, Optional, Dict, Any, List
 
 import docker
 from docker.errors import APIError, DockerException
@@ -13,8 +13,12 @@ class DockerEventWatcher:
     """
     Docker event watcher:
         - opens stream with client.events(decode=True)
-        - sends raw events to a callback
-        - reconnects with exponential backoff
+        - hands raw events to worker threads through a bounded queue,
+          so a slow callback never stalls the stream reader
+        - one worker by default, which keeps callbacks in stream order
+          (with more workers, events of one container may be reordered)
+        - on stop(), events already queued are still delivered to the callback
+        - reconnects with jittered exponential backoff
         - supports graceful stop via stop()
     """
 
@@ -27,6 +31,8 @@ class DockerEventWatcher:
         backoff_factor: float = 2.0,
         max_backoff: float = 60.0,
         max_retries: Optional[int] = None,
+        queue_size: int = 1000,
+        n_workers: int = 1,
     ):
         self.client = client
         self.callback = callback
@@ -34,9 +40,13 @@ class DockerEventWatcher:
         self.backoff_factor = float(backoff_factor)
         self.max_backoff = float(max_backoff)
         self.max_retries = None if max_retries is None else int(max_retries)
+        self.n_workers = max(1, int(n_workers))
 
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=int(queue_size))
         self._stop_event = threading.Event()
         self._worker: Optional[threading.Thread] = None
+        self._consumers: List[threading.Thread] = []
+        self._stream: Optional[Any] = None
 
     def start_in_background(self) -> None:
         """
@@ -46,6 +56,7 @@ class DockerEventWatcher:
             logger.warning("DockerEventWatcher already running.")
             return
 
+        self._start_consumers()
         self._worker = threading.Thread(
             target=self._run,
             daemon=True,
@@ -59,7 +70,10 @@ class DockerEventWatcher:
         Starts the watcher on the current thread (blocking).
         """
         logger.info("DockerEventWatcher starting in foreground (blocking) mode.")
+        self._start_consumers()
         self._run()
+        # _run returned (stop() or retries exhausted): let workers finish their callbacks
+        self._join_consumers()
 
     def stop(self) -> None:
         """
@@ -67,16 +81,90 @@ class DockerEventWatcher:
         """
         logger.info("Stopping DockerEventWatcher...")
         self._stop_event.set()
+
+        # Unblock a reader waiting on the next event instead of relying on the join timeout
+        stream = self._stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception as exc:
+                logger.debug("Error while closing Docker event stream: %s", exc)
+
         if self._worker:
             self._worker.join(timeout=5.0)
             logger.info("DockerEventWatcher thread joined.")
+        self._join_consumers()
+
+    def _join_consumers(self) -> None:
+        for consumer in self._consumers:
+            consumer.join(timeout=5.0)
+        self._consumers = []
+
+    def _start_consumers(self) -> None:
+        """
+        Starts the worker threads that pop raw events and run the callback.
+        """
+        self._consumers = [
+            threading.Thread(
+                target=self._consume,
+                daemon=True,
+                name=f"DockerEventWorker-{i}"
+            )
+            for i in range(self.n_workers)
+        ]
+        for consumer in self._consumers:
+            consumer.start()
+
+    def _consume(self) -> None:
+        """
+        Worker loop: forwards queued raw events to the callback until stopped
+        and the queue has been drained.
+        """
+        while True:
+            try:
+                raw_event = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    break
+                continue
+
+            try:
+                self.callback(raw_event)
+            except Exception as cb_exc:
+                logger.exception("Error inside event callback: %s", cb_exc)
+            finally:
+                self._queue.task_done()
+
+    def _enqueue(self, raw_event: Dict[str, Any]) -> None:
+        """
+        Pushes a raw event to the worker queue, dropping the oldest
+        pending event when the queue stays full.
+        """
+        while True:
+            try:
+                self._queue.put(raw_event, timeout=0.1)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    logger.warning("Event queue full (%d); dropped oldest pending event.", self._queue.maxsize)
+                except queue.Empty:
+                    pass
+
+    def _next_backoff(self, backoff: float) -> float:
+        """
+        Decorrelated jitter: spreads reconnects of several watchers
+        pointed at the same daemon instead of retrying in lockstep.
+        """
+        return min(self.max_backoff, random.uniform(self.initial_backoff, backoff * self.backoff_factor))
 
     def _run(self) -> None:
         """
         Main event loop:
         - tries to open event stream
-        - forwards events to callback
-        - reconnects on error with exponential backoff
+        - forwards events to the worker queue
+        - reconnects on error with jittered exponential backoff
         """
         retries = 0
         backoff = self.initial_backoff
@@ -84,7 +172,7 @@ class DockerEventWatcher:
         while not self._stop_event.is_set():
             try:
                 logger.info("Opening Docker event stream...")
-                stream = self.client.events(decode=True)
+                stream = self._stream = self.client.events(decode=True)
 
                 # Reset state after successful open
                 retries = 0
@@ -95,10 +183,7 @@ class DockerEventWatcher:
                         logger.info("Stop requested — breaking event loop.")
                         break
 
-                    try:
-                        self.callback(raw_event)
-                    except Exception as cb_exc:
-                        logger.exception("Error inside event callback: %s", cb_exc)
+                    self._enqueue(raw_event)
 
                 if self._stop_event.is_set():
                     break
@@ -106,9 +191,12 @@ class DockerEventWatcher:
                 logger.warning(
                     "Docker event stream closed unexpectedly; will attempt to reconnect."
                 )
-                time.sleep(backoff)
+                self._stop_event.wait(backoff)
 
             except (APIError, DockerException, OSError) as exc:
+                if self._stop_event.is_set():
+                    break
+
                 retries += 1
                 logger.error("Docker event stream error: %s", exc)
 
@@ -123,12 +211,18 @@ class DockerEventWatcher:
                     "Reconnecting to Docker events in %.1fs (attempt %d).",
                     backoff, retries
                 )
-                time.sleep(backoff)
-                backoff = min(backoff * self.backoff_factor, self.max_backoff)
+                self._stop_event.wait(backoff)
+                backoff = self._next_backoff(backoff)
 
             except Exception as exc:
+                if self._stop_event.is_set():
+                    break
+
                 logger.exception("Unexpected error in DockerEventWatcher main loop: %s", exc)
-                time.sleep(backoff)
-                backoff = min(backoff * self.backoff_factor, self.max_backoff)
+                self._stop_event.wait(backoff)
+                backoff = self._next_backoff(backoff)
 
+        self._stream = None
+        # Also reached when retries are exhausted: signal the workers to drain and exit
+        self._stop_event.set()
         logger.info("DockerEventWatcher stopped.")
@@ -19,23 +19,25 @@ except ImportError:
     Style = _NoColor()
     USE_COLORS = False
 
+_RESET = Style.RESET_ALL
+
 class ColorFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
-        if USE_COLORS:
-            COLORS = {
-                "DEBUG": Fore.CYAN,
-                "INFO": Fore.GREEN,
-                "WARNING": Fore.YELLOW,
-                "ERROR": Fore.RED,
-                "CRITICAL": Fore.RED + Style.BRIGHT,
-            }
-            color = COLORS.get(record.levelname, "")
-        else:
-            color = ""
+    # Built once; empty when colorama is unavailable
+    _COLORS = {
+        "DEBUG": Fore.CYAN,
+        "INFO": Fore.GREEN,
+        "WARNING": Fore.YELLOW,
+        "ERROR": Fore.RED,
+        "CRITICAL": Fore.RED + Style.BRIGHT,
+    } if USE_COLORS else {}
 
+    def format(self, record: logging.LogRecord) -> str:
         msg = super().format(record)
 
-        return f"{color}{msg}{Style.RESET_ALL}" if USE_COLORS else msg
+        if not USE_COLORS:
+            return msg
+
+        return f"{self._COLORS.get(record.levelname, '')}{msg}{_RESET}"
 
 def create_logger() -> logging.Logger:
     logger = logging.getLogger("MoonDock")
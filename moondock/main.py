@@ -1,15 +1,19 @@
+from moondock.config import CRITICAL_EVENTS
 from moondock.logger import logger
 from moondock.clients.docker_client import init_docker
 from moondock.clients.discord_client import DiscordClient
 from moondock.events.watcher import DockerEventWatcher
 from moondock.events.parser import parse_event, NormalizedEvent
 
+# Only these normalized actions are forwarded to Discord
+_CRITICAL = frozenset(CRITICAL_EVENTS)
+
 def docker_event_callback(raw_event: dict, discord_client: DiscordClient) -> None:
-    ne: NormalizedEvent | None = parse_event(raw_event)
+    ne: NormalizedEvent | None = parse_event(raw_event, _CRITICAL)
     if ne:
         try:
             discord_client.send_event(ne)
-            logger.info("Event sent to Discord: %s %s", ne.domain, ne.action)
+            logger.info("Event dispatched to Discord: %s %s", ne.domain, ne.action)
         except Exception as exc:
             logger.exception("Failed to send event to Discord: %s", exc)
 
@@ -30,6 +34,8 @@ def main() -> None:
     except Exception as exc:
         logger.critical("Unexpected error in main loop: %s", exc)
         watcher.stop()
+    finally:
+        discord_client.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,8 @@
+from moondock.config import _load_config
+
+def test_critical_events_are_lowercased(monkeypatch):
+    monkeypatch.setenv("CRITICAL_EVENTS", "DIE, Oom,,restart")
+
+    config = _load_config.__wrapped__()
+
+    assert config.critical_events == ("die", "oom", "restart")
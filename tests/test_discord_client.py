@@ -0,0 +1,300 @@
+import asyncio
+from collections import deque
+import json
+import math
+import time
+import pytest
+from concurrent.futures import Future
+from unittest.mock import patch
+from moondock.clients.discord_client import DiscordClient
+from moondock.events.parser import parse_event
+from moondock.logger import logger
+
+class StubResponse:
+    def __init__(self, status: int = 204, headers: dict = None, body: dict = None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body or {}
+
+    async def json(self, content_type=None):
+        return self._body
+
+    async def text(self):
+        return json.dumps(self._body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class StubSession:
+    """
+    Stands in for aiohttp.ClientSession: records posted bodies and replays
+    queued responses (204 once they run out).
+    """
+    def __init__(self, responses=None):
+        self.responses = list(responses or [])
+        self.posts = []
+
+    def post(self, url, data=None):
+        self.posts.append((url, json.loads(data)))
+        return self.responses.pop(0) if self.responses else StubResponse()
+
+    async def close(self):
+        pass
+
+def stub_client(webhook_urls="https://discord.example/api/webhooks/1/token", responses=None, cls=DiscordClient):
+    client = cls(webhook_urls=webhook_urls)
+    real_session = client._session
+    client._session = StubSession(responses)
+    asyncio.run_coroutine_threadsafe(real_session.close(), client._loop).result()
+    return client
+
+def sample_event(action: str) -> dict:
+    return {
+        "Type": "container",
+        "Action": action,
+        "id": "91ab3921c2384f5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1b2c3d4e5f6a7b8c9",
+        "Actor": {"Attributes": {"name": "my_test_container", "image": "busybox:latest"}},
+    }
+
+@pytest.fixture
+def client():
+    client = DiscordClient(webhook_urls=[])
+    try:
+        yield client
+    finally:
+        client.close()
+
+def test_build_embed_style(client):
+    embed = client._build_embed(parse_event(sample_event("die")))
+    assert embed["color"] == 0xFF0000
+    assert embed["title"].startswith("🪦")
+
+    embed = client._build_embed(parse_event(sample_event("exec_start")))
+    assert embed["color"] == 0x808080
+
+def test_build_embed_description(client):
+    raw = sample_event("die")
+    raw["Actor"]["Attributes"]["exitCode"] = "137"
+
+    embed = client._build_embed(parse_event(raw))
+    assert embed["description"] == (
+        "```Domain      : container\n"
+        "Action      : die\n"
+        "Name        : my_test_container\n"
+        "Image       : busybox:latest\n"
+        "ID          : 91ab3921c238\n"
+        "Exit Code   : 137```"
+    )
+
+def test_accepts_single_or_multiple_webhooks():
+    single = DiscordClient(webhook_urls="https://discord.example/a")
+    multiple = DiscordClient(webhook_urls=["https://discord.example/a", "https://discord.example/b"])
+
+    assert single.webhook_urls == ["https://discord.example/a"]
+    assert multiple.webhook_urls == ["https://discord.example/a", "https://discord.example/b"]
+
+    single.close()
+    multiple.close()
+
+def test_queued_embeds_are_batched_per_post():
+    client = stub_client()
+    event = parse_event(sample_event("die"))
+    results = []
+
+    async def enqueue_all():
+        # queued in one loop step so the flusher sees them all at once
+        for _ in range(25):
+            result = Future()
+            client._enqueue(client._build_embed(event), result)
+            results.append(result)
+
+    try:
+        asyncio.run_coroutine_threadsafe(enqueue_all(), client._loop).result()
+
+        assert all(result.result(5) for result in results)
+        assert len(client._session.posts) == math.ceil(25 / client.MAX_EMBEDS_PER_MESSAGE)
+        assert [len(body["embeds"]) for _, body in client._session.posts] == [10, 10, 5]
+    finally:
+        client.close()
+
+class SmallQueueClient(DiscordClient):
+    MAX_QUEUED_EMBEDS = 3
+
+def test_full_queue_drops_event():
+    client = stub_client(cls=SmallQueueClient)
+    event = parse_event(sample_event("die"))
+    dropped = Future()
+
+    async def overfill():
+        for _ in range(client.MAX_QUEUED_EMBEDS):
+            client._enqueue(client._build_embed(event), Future())
+        client._enqueue(client._build_embed(event), dropped)
+
+    try:
+        asyncio.run_coroutine_threadsafe(overfill(), client._loop).result()
+        assert dropped.result(1) is False
+    finally:
+        client.close()
+
+class HangingSession(StubSession):
+    def post(self, url, data=None):
+        self.posts.append((url, json.loads(data)))
+        return HangingResponse()
+
+class HangingResponse(StubResponse):
+    async def __aenter__(self):
+        await asyncio.sleep(3600)
+
+def test_close_fails_in_flight_and_later_events():
+    client = DiscordClient(webhook_urls="https://discord.example/api/webhooks/1/token", timeout=0.2)
+    real_session = client._session
+    client._session = HangingSession()
+    asyncio.run_coroutine_threadsafe(real_session.close(), client._loop).result()
+    event = parse_event(sample_event("die"))
+
+    in_flight = client.send_event(event)
+
+    # make sure the flusher picked the embed up and the POST is hanging
+    deadline = time.time() + 2
+    while not client._session.posts and time.time() < deadline:
+        time.sleep(0.01)
+    assert client._session.posts
+
+    client.close()
+
+    assert in_flight.result(1) is False
+    assert client.send_event(event).result(1) is False
+
+def test_close_flushes_events_sent_just_before():
+    client = stub_client()
+    event = parse_event(sample_event("die"))
+
+    results = [client.send_event(event) for _ in range(5)]
+    client.close()
+
+    assert [result.result(1) for result in results] == [True] * 5
+    assert sum(len(body["embeds"]) for _, body in client._session.posts) == 5
+
+def test_rate_limited_post_is_retried():
+    client = stub_client(responses=[StubResponse(429, body={"retry_after": 0.01})])
+    try:
+        assert client.send_event(parse_event(sample_event("die"))).result(5) is True
+        assert len(client._session.posts) == 2
+    finally:
+        client.close()
+
+def test_retry_after_prefers_body_then_header():
+    client = stub_client()
+    try:
+        def retry_after(response):
+            return asyncio.run_coroutine_threadsafe(client._retry_after(response), client._loop).result()
+
+        assert retry_after(StubResponse(429, {"Retry-After": "2"}, {"retry_after": 0.5})) == 0.5
+        assert retry_after(StubResponse(429, {"Retry-After": "2"}, ["not", "a", "dict"])) == 2.0
+        assert retry_after(StubResponse(429, {"Retry-After": "bogus"}, {"retry_after": "bogus"})) == 1.0
+    finally:
+        client.close()
+
+def test_exhausted_bucket_delays_next_send_not_current():
+    url = "https://discord.example/api/webhooks/1/token"
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "30"}
+    client = stub_client(url, responses=[StubResponse(204, headers)])
+    try:
+        # resolves right away even though the bucket resets in 30s
+        assert client.send_event(parse_event(sample_event("die"))).result(1) is True
+        assert client._blocked_until[url] - client._loop.time() > 25
+    finally:
+        client._blocked_until.clear()
+        client.close()
+
+def test_malformed_reset_header_keeps_delivery_successful():
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "bogus"}
+    client = stub_client(responses=[StubResponse(204, headers)])
+    try:
+        assert client.send_event(parse_event(sample_event("die"))).result(1) is True
+    finally:
+        client.close()
+
+class TightLimitClient(DiscordClient):
+    RATE_LIMIT_REQUESTS = 2
+    RATE_LIMIT_WINDOW = 0.3
+
+def test_throttle_waits_for_window_and_blocked_bucket():
+    url = "https://discord.example/api/webhooks/1/token"
+    client = stub_client(url, cls=TightLimitClient)
+
+    async def timed_throttles():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            await client._throttle(url)
+        windowed = loop.time() - started
+
+        client._blocked_until[url] = loop.time() + 0.2
+        started = loop.time()
+        await client._throttle(url)
+        return windowed, loop.time() - started
+
+    try:
+        windowed, blocked = asyncio.run_coroutine_threadsafe(timed_throttles(), client._loop).result(5)
+        assert windowed >= 0.25
+        assert blocked >= 0.15
+    finally:
+        client.close()
+
+def test_webhook_url_keyword_is_deprecated_alias():
+    with pytest.warns(DeprecationWarning):
+        client = DiscordClient(webhook_url="https://discord.example/a")
+    try:
+        assert client.webhook_urls == ["https://discord.example/a"]
+    finally:
+        client.close()
+
+class NoRetryClient(DiscordClient):
+    MAX_RATE_LIMIT_RETRIES = 0
+
+def test_last_rate_limited_attempt_gives_up_without_sleeping():
+    client = stub_client(responses=[StubResponse(429, body={"retry_after": 30})], cls=NoRetryClient)
+    try:
+        assert client.send_event(parse_event(sample_event("die"))).result(1) is False
+        assert len(client._session.posts) == 1
+    finally:
+        client.close()
+
+def test_webhook_urls_never_reach_the_logs(caplog):
+    secret = "discord.com/api/webhooks/123/SECRETTOKEN"
+    client = DiscordClient(webhook_urls=[secret, "https://" + secret])
+    try:
+        assert client.webhook_urls == ["https://" + secret]
+
+        # force an aiohttp error whose message carries the URL
+        client.webhook_urls = ["http://[invalid/api/webhooks/123/SECRETTOKEN"]
+        client._sent_at = {url: deque() for url in client.webhook_urls}
+        with caplog.at_level("INFO", logger="MoonDock"):
+            logger.propagate = True
+            try:
+                assert client.send_event(parse_event(sample_event("die"))).result(5) is False
+            finally:
+                logger.propagate = False
+    finally:
+        client.close()
+
+    assert "SECRETTOKEN" not in caplog.text
+    assert "Ignoring Discord webhook #0" in caplog.text
+    assert "Exception while sending event to Discord webhook #0: InvalidUrlClientError" in caplog.text
+
+def test_empty_webhook_falls_back_to_config():
+    with patch("moondock.clients.discord_client.DISCORD_WEBHOOKS", ("https://discord.example/env",)):
+        clients = [DiscordClient(), DiscordClient(""), DiscordClient(webhook_urls=[])]
+    try:
+        assert [c.webhook_urls for c in clients] == [
+            ["https://discord.example/env"],
+            ["https://discord.example/env"],
+            [],
+        ]
+    finally:
+        for c in clients:
+            c.close()
@@ -0,0 +1,18 @@
+import docker
+from unittest.mock import patch
+from moondock.clients import docker_client
+
+def test_init_docker_only_retries_connect_errors():
+    # real client and adapter, without contacting a daemon
+    client = docker.DockerClient(base_url="tcp://127.0.0.1:2375", version="1.41")
+
+    with patch.object(docker_client, "DOCKER_HOST", "unix:///var/run/docker.sock"), \
+         patch("moondock.clients.docker_client.docker.DockerClient", return_value=client), \
+         patch.object(client, "ping", return_value=True):
+        assert docker_client.init_docker() is client
+
+    retries = client.api.get_adapter(client.api.base_url).max_retries
+    assert retries.total == 3
+    assert retries.connect == 3
+    assert retries.read == 0
+    assert retries.status == 0
@@ -23,4 +23,14 @@ def test_main_initialization():
         # Positional arguments
         assert args[0] == mock_client
         assert callable(args[1])  # the callback lambda
-        MockDiscord.assert_called_once()
\ No newline at end of file
+        MockDiscord.assert_called_once()
+        mock_discord_instance.close.assert_called_once()
+
+def test_callback_forwards_only_critical_events():
+    discord = MagicMock()
+
+    main_module.docker_event_callback({"Type": "container", "Action": "exec_start", "id": "abc"}, discord)
+    discord.send_event.assert_not_called()
+
+    main_module.docker_event_callback({"Type": "container", "Action": "die", "id": "abc"}, discord)
+    discord.send_event.assert_called_once()
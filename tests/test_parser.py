@@ -1,3 +1,5 @@
+import dataclasses
+import pytest
 import time
 from moondock.events.parser import parse_event, NormalizedEvent
 from moondock.logger import logger
@@ -28,6 +30,7 @@ def test_parse_die_event():
     assert ne.domain == "container"
     assert ne.action == "die"
     assert ne.id.startswith("91ab3921c238")  # partial match to avoid full id dependence
+    assert ne.short_id == "91ab3921c238"
     assert ne.name == "my_test_container"
     assert ne.image == "busybox:latest"
     assert isinstance(ne.timestamp, float)
@@ -36,4 +39,74 @@ def test_parse_die_event():
 def test_parse_non_dict_returns_none():
     assert parse_event(None) is None # Changed to pass an empty dict, as None is not a valid type for raw # type: ignore
     assert parse_event("not-a-dict") is None # type: ignore
-    
\ No newline at end of file
+
+def test_parse_action_normalization():
+    raw = sample_die_event()
+    raw["Action"] = "Health_Status: Healthy"
+    assert parse_event(raw).action == "health_healthy"
+
+    raw["Action"] = "  Exec_Start  "
+    assert parse_event(raw).action == "exec_start"
+
+def test_normalized_event_is_immutable():
+    ne = parse_event(sample_die_event())
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ne.action = "start"  # type: ignore[misc]
+
+    assert not hasattr(ne, "__dict__")
+
+def test_parse_skips_unlisted_actions():
+    raw = sample_die_event()
+
+    assert parse_event(raw, frozenset({"oom"})) is None
+    assert parse_event(raw, frozenset({"die"})).action == "die"
+
+def test_parse_keeps_raw_only_for_debug():
+    raw = sample_die_event()
+    level = logger.level
+
+    try:
+        logger.setLevel("INFO")
+        assert parse_event(raw).raw is None
+
+        logger.setLevel("DEBUG")
+        assert parse_event(raw).raw is raw
+    finally:
+        logger.setLevel(level)
+
+def test_parse_generic_event_uses_actor_id():
+    raw = {
+        "Type": "network",
+        "Action": "connect",
+        "Actor": {"ID": "5f2a9c1d0e3b7a8c", "Attributes": {"name": "bridge"}},
+    }
+    ne = parse_event(raw)
+
+    assert ne.id == "5f2a9c1d0e3b7a8c"
+    assert ne.name == "bridge"
+
+def test_parse_timestamp_from_time_nano():
+    raw = sample_die_event()
+    del raw["time"]
+    raw["timeNano"] = 1_700_000_000_500_000_000
+
+    assert parse_event(raw).timestamp == 1_700_000_000.5
+
+def test_parse_malformed_timestamp_falls_back_to_now():
+    for bad in ({"time": "bogus"}, {"timeNano": "123"}, {"time": -5}):
+        raw = sample_die_event()
+        del raw["time"]
+        raw.update(bad)
+
+        before = time.time()
+        ne = parse_event(raw)
+        assert ne is not None
+        assert ne.timestamp >= before
+
+def test_parse_malformed_time_uses_valid_time_nano():
+    raw = sample_die_event()
+    raw["time"] = "bogus"
+    raw["timeNano"] = 1_700_000_000_500_000_000
+
+    assert parse_event(raw).timestamp == 1_700_000_000.5
@@ -1,4 +1,6 @@
 import time
+from unittest.mock import MagicMock
+from docker.errors import DockerException
 from moondock.clients.docker_client import init_docker
 from moondock.events.watcher import DockerEventWatcher
 from moondock.logger import logger
@@ -6,7 +8,7 @@ from moondock.logger import logger
 received_events = []
 
 def callback(event):
-    logger.info(f"[TEST CALLBACK] Received event: {event}")
+    logger.info("[TEST CALLBACK] Received event: %s", event)
     received_events.append(event)
 
 
@@ -30,3 +32,52 @@ def test_docker_event_watcher_basic():
 
     assert watcher._stop_event.is_set(), "Watcher did not stop"
     assert len(received_events) >= 0
+
+def test_watcher_forwards_events_through_workers():
+    events = [{"Type": "container", "Action": "start", "id": str(i)} for i in range(5)]
+    client = MagicMock()
+    client.events.return_value = iter(events)
+    forwarded = []
+
+    watcher = DockerEventWatcher(client=client, callback=forwarded.append)
+    watcher.start_in_background()
+
+    deadline = time.time() + 3
+    while len(forwarded) < len(events) and time.time() < deadline:
+        time.sleep(0.05)
+
+    watcher.stop()
+
+    # single default worker keeps stream order
+    assert [e["id"] for e in forwarded] == [str(i) for i in range(5)]
+
+def test_backoff_jitter_stays_within_bounds():
+    watcher = DockerEventWatcher(client=MagicMock(), callback=callback, initial_backoff=1, max_backoff=5)
+
+    for _ in range(100):
+        assert 1 <= watcher._next_backoff(4) <= 5
+
+def test_stop_drains_queued_events():
+    client = MagicMock()
+    forwarded = []
+    watcher = DockerEventWatcher(client=client, callback=forwarded.append)
+
+    for i in range(3):
+        watcher._enqueue({"id": str(i)})
+    watcher._start_consumers()
+    watcher.stop()
+
+    assert [e["id"] for e in forwarded] == ["0", "1", "2"]
+
+def test_workers_exit_when_retries_are_exhausted():
+    client = MagicMock()
+    client.events.side_effect = DockerException("daemon down")
+    watcher = DockerEventWatcher(client=client, callback=callback, initial_backoff=0.01, max_backoff=0.01, max_retries=1)
+
+    started = time.time()
+    watcher.start_forever()
+
+    assert watcher._stop_event.is_set()
+    assert watcher._consumers == []
+    # workers exited on their own instead of running into the join timeout
+    assert time.time() - started < 2